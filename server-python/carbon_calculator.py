@@ -1,7 +1,23 @@
 from typing import List, Optional, Dict, Union
+from collections import defaultdict
+from itertools import chain
+import numpy as np
 from pydantic import BaseModel, Field
 from enum import Enum
 
+from .utils_numba import (
+    UNIT_CODE_LITERS, UNIT_CODE_M3, UNIT_CODE_TONNES, UNIT_CODE_KM,
+    _combust_kernel, _scope1_batch_kernel, _air_travel_reduce,
+)
+
+# Prefer the ahead-of-time compiled Cython kernel when its extension has been
+# built (see setup.py): same arithmetic as the Numba version but with zero
+# JIT warmup, which matters for cold-start containers.
+try:
+    from .carbon_kernels import combust_kernel as _combust_kernel
+except ImportError:
+    pass
+
 # --- Constants ---
 # Global Warming Potentials (GWP)
 GWP_CH4 = 28
@@ -82,6 +98,30 @@ class Unit(str, Enum):
     KWH = "kWh" # For electricity, if needed
     KM = "km" # For distance-based calculation
 
+# Integer fuel indices and NumPy emission-factor lookup tables, so the batched
+# Scope 1 path can resolve factors by array indexing instead of per-fuel
+# branching. Fuels without default factors (e.g. Electricity) are absent and
+# must carry explicit emission-factor overrides.
+_FUEL_INDEX = {
+    FuelType.NATURAL_GAS: 0,
+    FuelType.HEATING_OIL: 1,
+    FuelType.DIESEL: 2,
+    FuelType.PETROL: 3,
+    FuelType.COAL: 4,
+}
+_EF_CO2_TABLE = np.array([EF_CO2_NATURAL_GAS, EF_CO2_HEATING_OIL, EF_CO2_DIESEL, EF_CO2_PETROL, EF_CO2_COAL])
+_EF_CH4_TABLE = np.array([EF_CH4_NATURAL_GAS, EF_CH4_HEATING_OIL, EF_CH4_DIESEL, EF_CH4_PETROL, EF_CH4_COAL])
+_EF_N2O_TABLE = np.array([EF_N2O_NATURAL_GAS, EF_N2O_HEATING_OIL, EF_N2O_DIESEL, EF_N2O_PETROL, EF_N2O_COAL])
+_FUEL_BY_INDEX = {index: fuel for fuel, index in _FUEL_INDEX.items()}
+
+# Default (density kg/l, calorific value MJ/kg) per liquid fuel. Heating Oil
+# density is assumed similar to diesel if not specified.
+_FUEL_PROPS = {
+    FuelType.DIESEL: (DENSITY_DIESEL, CALORIFIC_VALUE_DIESEL_MJ_KG),
+    FuelType.PETROL: (DENSITY_PETROL, CALORIFIC_VALUE_PETROL_MJ_KG),
+    FuelType.HEATING_OIL: (DENSITY_DIESEL, CALORIFIC_VALUE_HEATING_OIL_MJ_KG),
+}
+
 class CombustionInput(BaseModel):
     source: str = Field(..., description="Source of combustion, e.g., 'Heating', 'Generators', 'Fleet'")
     fuel_type: FuelType
@@ -130,104 +170,93 @@ class Scope1Output(BaseModel):
 
 # --- Core Calculation Logic ---
 
-def calculate_combustion_emissions(input_data: CombustionInput) -> EmissionResult:
-    """Calculates CO2e for combustion activities (Heating, Generators, Fleet Method 1 & 2)."""
-    energy_gj: float = 0.0
-    mass_co2: float = 0.0
-    mass_ch4: float = 0.0
-    mass_n2o: float = 0.0
-
-    # Determine Calorific Value and Density
+def _resolve_combustion_input(input_data: CombustionInput):
+    """Validates a combustion input and resolves its defaults.
+
+    Returns (amount, density_kg_l, calorific_value, unit_code, ef_co2, ef_ch4,
+    ef_n2o) ready for the numeric kernels; `amount` is the fuel quantity in
+    the unit implied by `unit_code` (estimated fuel mass in kg for
+    UNIT_CODE_KM), and density is 0.0 where it does not apply.
+    """
+    # Read each model field once up front: on the batched path this function
+    # runs per item, and locals are much cheaper than repeated Pydantic
+    # attribute access.
+    fuel_type = input_data.fuel_type
+    unit = input_data.unit
     calorific_value_mj_kg = input_data.calorific_value_mj_kg
     density_kg_l = input_data.density_kg_l
 
-    if input_data.unit == Unit.LITERS: # Liquid Fuels (Heating Oil, Diesel, Petrol)
-        if input_data.fuel_type == FuelType.DIESEL:
-            density_kg_l = density_kg_l or DENSITY_DIESEL
-            calorific_value_mj_kg = calorific_value_mj_kg or CALORIFIC_VALUE_DIESEL_MJ_KG
-        elif input_data.fuel_type == FuelType.PETROL:
-            density_kg_l = density_kg_l or DENSITY_PETROL
-            calorific_value_mj_kg = calorific_value_mj_kg or CALORIFIC_VALUE_PETROL_MJ_KG
-        elif input_data.fuel_type == FuelType.HEATING_OIL:
-             density_kg_l = density_kg_l or DENSITY_DIESEL # Assuming similar to diesel if not specified
-             calorific_value_mj_kg = calorific_value_mj_kg or CALORIFIC_VALUE_HEATING_OIL_MJ_KG
-        
+    if unit == Unit.LITERS: # Liquid Fuels (Heating Oil, Diesel, Petrol)
+        fuel_props = _FUEL_PROPS.get(fuel_type)
+        if fuel_props is not None:
+            density_kg_l = density_kg_l or fuel_props[0]
+            calorific_value_mj_kg = calorific_value_mj_kg or fuel_props[1]
+
         if density_kg_l is None or calorific_value_mj_kg is None:
-            raise ValueError(f"Density or Calorific Value missing for liquid fuel type {input_data.fuel_type}")
-        
-        # Energy(GJ)=(Volume(l)×Density(kg/l)×CalorificValue(MJ/kg)) / 1000
-        energy_gj = (input_data.amount * density_kg_l * calorific_value_mj_kg) / 1000
+            raise ValueError(f"Density or Calorific Value missing for liquid fuel type {fuel_type}")
 
-    elif input_data.unit == Unit.M3 and input_data.fuel_type == FuelType.NATURAL_GAS:
+        amount = input_data.amount
+        unit_code = UNIT_CODE_LITERS
+
+    elif unit == Unit.M3 and fuel_type == FuelType.NATURAL_GAS:
         # For Natural Gas, calorific value is typically per m3, so direct conversion
-        calorific_value_mj_m3 = calorific_value_mj_kg or CALORIFIC_VALUE_NATURAL_GAS_MJ_M3 # Using calorific_value_mj_kg field for MJ/m3
-        if calorific_value_mj_m3 is None:
-             raise ValueError("Calorific Value missing for Natural Gas")
-        energy_gj = input_data.amount * (calorific_value_mj_m3 / 1000) # Convert MJ to GJ
-
-    elif input_data.unit == Unit.TONNES and input_data.fuel_type == FuelType.COAL:
-        calorific_value_mj_kg = input_data.calorific_value_mj_kg or CALORIFIC_VALUE_COAL_MJ_KG
-        if calorific_value_mj_kg is None:
-             raise ValueError("Calorific Value missing for Coal")
-        energy_gj = input_data.amount * 1000 * (calorific_value_mj_kg / 1000) # tonnes to kg, MJ to GJ
-    
-    elif input_data.unit == Unit.KM and input_data.source == "Fleet": # Fleet Method 2 (Distance-based)
-        if input_data.distance_km is None or input_data.vehicle_type is None:
+        calorific_value_mj_kg = calorific_value_mj_kg or CALORIFIC_VALUE_NATURAL_GAS_MJ_M3 # Using calorific_value_mj_kg field for MJ/m3
+        amount = input_data.amount
+        unit_code = UNIT_CODE_M3
+
+    elif unit == Unit.TONNES and fuel_type == FuelType.COAL:
+        calorific_value_mj_kg = calorific_value_mj_kg or CALORIFIC_VALUE_COAL_MJ_KG
+        amount = input_data.amount
+        unit_code = UNIT_CODE_TONNES
+
+    elif unit == Unit.KM and input_data.source == "Fleet": # Fleet Method 2 (Distance-based)
+        distance_km = input_data.distance_km
+        if distance_km is None or input_data.vehicle_type is None:
             raise ValueError("distance_km and vehicle_type are required for distance-based fleet calculation.")
-        
+
         # Estimate fuel usage based on distance and typical consumption
         # For Passenger Car Diesel = 60g/km (0.06 kg/km)
-        # Convert to liters: kg / density_kg_l
-        estimated_fuel_kg = input_data.distance_km * (FUEL_CONSUMPTION_PASSENGER_CAR_DIESEL_G_KM / 1000) # in kg
-        
+        estimated_fuel_kg = distance_km * (FUEL_CONSUMPTION_PASSENGER_CAR_DIESEL_G_KM / 1000) # in kg
+
         # Assuming diesel for now based on example, needs to be more robust
         density_kg_l = density_kg_l or DENSITY_DIESEL
         calorific_value_mj_kg = calorific_value_mj_kg or CALORIFIC_VALUE_DIESEL_MJ_KG
 
-        if density_kg_l is None or calorific_value_mj_kg is None:
-            raise ValueError(f"Density or Calorific Value missing for estimated liquid fuel for vehicle type {input_data.vehicle_type}")
+        amount = estimated_fuel_kg
+        unit_code = UNIT_CODE_KM
 
-        estimated_fuel_liters = estimated_fuel_kg / density_kg_l
-        energy_gj = (estimated_fuel_liters * density_kg_l * calorific_value_mj_kg) / 1000
-        
     else:
-        raise ValueError(f"Unsupported unit '{input_data.unit}' or fuel type '{input_data.fuel_type}' combination for combustion calculation, or missing distance/vehicle type for fleet method 2.")
+        raise ValueError(f"Unsupported unit '{unit}' or fuel type '{fuel_type}' combination for combustion calculation, or missing distance/vehicle type for fleet method 2.")
 
-    # Determine Emission Factors (kg/GJ)
+    # Determine Emission Factors (kg/GJ): override, else table lookup by fuel
     ef_co2 = input_data.emission_factor_co2_kg_gj
     ef_ch4 = input_data.emission_factor_ch4_kg_gj
     ef_n2o = input_data.emission_factor_n2o_kg_gj
 
-    if input_data.fuel_type == FuelType.NATURAL_GAS:
-        ef_co2 = ef_co2 or EF_CO2_NATURAL_GAS
-        ef_ch4 = ef_ch4 or EF_CH4_NATURAL_GAS
-        ef_n2o = ef_n2o or EF_N2O_NATURAL_GAS
-    elif input_data.fuel_type == FuelType.HEATING_OIL:
-        ef_co2 = ef_co2 or EF_CO2_HEATING_OIL
-        ef_ch4 = ef_ch4 or EF_CH4_HEATING_OIL
-        ef_n2o = ef_n2o or EF_N2O_HEATING_OIL
-    elif input_data.fuel_type == FuelType.DIESEL:
-        ef_co2 = ef_co2 or EF_CO2_DIESEL
-        ef_ch4 = ef_ch4 or EF_CH4_DIESEL
-        ef_n2o = ef_n2o or EF_N2O_DIESEL
-    elif input_data.fuel_type == FuelType.PETROL:
-        ef_co2 = ef_co2 or EF_CO2_PETROL
-        ef_ch4 = ef_ch4 or EF_CH4_PETROL
-        ef_n2o = ef_n2o or EF_N2O_PETROL
-    elif input_data.fuel_type == FuelType.COAL:
-        ef_co2 = ef_co2 or EF_CO2_COAL
-        ef_ch4 = ef_ch4 or EF_CH4_COAL
-        ef_n2o = ef_n2o or EF_N2O_COAL
-    
+    fuel_index = _FUEL_INDEX.get(fuel_type)
+    if fuel_index is not None:
+        ef_co2 = ef_co2 or float(_EF_CO2_TABLE[fuel_index])
+        ef_ch4 = ef_ch4 or float(_EF_CH4_TABLE[fuel_index])
+        ef_n2o = ef_n2o or float(_EF_N2O_TABLE[fuel_index])
+
     if ef_co2 is None or ef_ch4 is None or ef_n2o is None:
-        raise ValueError(f"Emission factors missing for fuel type {input_data.fuel_type}")
+        raise ValueError(f"Emission factors missing for fuel type {fuel_type}")
+
+    return amount, density_kg_l or 0.0, calorific_value_mj_kg, unit_code, ef_co2, ef_ch4, ef_n2o
+
+def calculate_combustion_emissions(input_data: CombustionInput) -> EmissionResult:
+    """Calculates CO2e for combustion activities (Heating, Generators, Fleet Method 1 & 2).
 
-    # Calculate Emissions
-    mass_co2 = energy_gj * ef_co2
-    mass_ch4 = energy_gj * ef_ch4
-    mass_n2o = energy_gj * ef_n2o
+    Validation and default resolution happen in `_resolve_combustion_input`;
+    the arithmetic itself runs in the JIT-compiled `_combust_kernel`.
+    """
+    amount, density_kg_l, calorific_value, unit_code, ef_co2, ef_ch4, ef_n2o = \
+        _resolve_combustion_input(input_data)
 
-    co2e = calculate_co2e(mass_co2, mass_ch4, mass_n2o)
+    energy_gj, mass_co2, mass_ch4, mass_n2o, co2e = _combust_kernel(
+        amount, density_kg_l, calorific_value, unit_code,
+        ef_co2, ef_ch4, ef_n2o, float(GWP_CH4), float(GWP_N2O),
+    )
 
     return EmissionResult(
         source=input_data.source,
@@ -241,23 +270,19 @@ def calculate_combustion_emissions(input_data: CombustionInput) -> EmissionResul
         }
     )
 
+_REFRIGERANT_GWP = {
+    RefrigerantType.R407C: GWP_R407C,
+    RefrigerantType.R32: GWP_R32,
+    RefrigerantType.R410A: GWP_R410A,
+}
+
 def calculate_fugitive_emissions(input_data: FugitiveEmissionInput) -> EmissionResult:
     """Calculates CO2e for fugitive emissions (Refrigerants)."""
-    gwp_factor = input_data.gwp_factor
-
-    if input_data.refrigerant_type == RefrigerantType.R407C:
-        gwp_factor = gwp_factor or GWP_R407C
-    elif input_data.refrigerant_type == RefrigerantType.R32:
-        gwp_factor = gwp_factor or GWP_R32
-    elif input_data.refrigerant_type == RefrigerantType.R410A:
-        gwp_factor = gwp_factor or GWP_R410A
-    elif input_data.refrigerant_type == RefrigerantType.CUSTOM:
-        if gwp_factor is None:
+    gwp_factor = input_data.gwp_factor or _REFRIGERANT_GWP.get(input_data.refrigerant_type)
+
+    if gwp_factor is None:
+        if input_data.refrigerant_type == RefrigerantType.CUSTOM:
             raise ValueError("GWP factor is required for custom refrigerant type.")
-    else:
-        raise ValueError(f"Unsupported refrigerant type: {input_data.refrigerant_type}")
-    
-    if gwp_factor is None: # Should not happen with above logic, but for safety
         raise ValueError(f"GWP factor could not be determined for {input_data.refrigerant_type}")
 
     co2e = input_data.amount_kg * gwp_factor
@@ -273,25 +298,157 @@ def calculate_fugitive_emissions(input_data: FugitiveEmissionInput) -> EmissionR
     )
 
 def calculate_scope1_emissions(input_data: Scope1CalculationInput) -> Scope1Output:
-    """Aggregates all Scope 1 emission calculations."""
-    total_co2e = 0.0
-    breakdown: List[EmissionResult] = []
+    """Aggregates all Scope 1 emission calculations.
 
-    for combustion_input in input_data.combustion_emissions:
-        result = calculate_combustion_emissions(combustion_input)
-        total_co2e += result.co2e
-        breakdown.append(result)
-    
-    for fugitive_input in input_data.fugitive_emissions:
+    Combustion inputs are resolved item by item (validation and defaults),
+    then the whole batch is computed with a few NumPy expressions instead of
+    per-item arithmetic calls.
+    """
+    total_co2e = 0.0
+    # Preallocate in one shot and index-assign, instead of growing the list
+    # append-by-append across both loops.
+    combustion_inputs = input_data.combustion_emissions
+    fugitive_inputs = input_data.fugitive_emissions
+    breakdown: List[EmissionResult] = [None] * (len(combustion_inputs) + len(fugitive_inputs))
+
+    if combustion_inputs:
+        columns = list(zip(*[_resolve_combustion_input(item) for item in combustion_inputs]))
+        amount, density, calorific_value = (np.array(column, dtype=np.float64) for column in columns[:3])
+        unit_code = np.array(columns[3], dtype=np.int64)
+        ef_co2, ef_ch4, ef_n2o = (np.array(column, dtype=np.float64) for column in columns[4:])
+
+        n = len(combustion_inputs)
+        energy_gj = np.empty(n)
+        mass_co2 = np.empty(n)
+        mass_ch4 = np.empty(n)
+        mass_n2o = np.empty(n)
+        co2e = np.empty(n)
+
+        total_co2e += _scope1_batch_kernel(
+            amount, density, calorific_value, unit_code, ef_co2, ef_ch4, ef_n2o,
+            float(GWP_CH4), float(GWP_N2O),
+            energy_gj, mass_co2, mass_ch4, mass_n2o, co2e,
+        )
+        for i, item in enumerate(combustion_inputs):
+            breakdown[i] = EmissionResult(
+                source=item.source,
+                fuel_type=item.fuel_type,
+                co2e=float(co2e[i]),
+                details={
+                    "energy_gj": float(energy_gj[i]),
+                    "mass_co2": float(mass_co2[i]),
+                    "mass_ch4": float(mass_ch4[i]),
+                    "mass_n2o": float(mass_n2o[i]),
+                }
+            )
+
+    for i, fugitive_input in enumerate(fugitive_inputs, start=len(combustion_inputs)):
         result = calculate_fugitive_emissions(fugitive_input)
         total_co2e += result.co2e
-        breakdown.append(result)
+        breakdown[i] = result
 
     return Scope1Output(
         total_co2e=total_co2e,
         breakdown=breakdown
     )
 
+def scope1_input_to_arrays(input_data: Scope1CalculationInput):
+    """Converts the combustion part of a Scope1CalculationInput to columns.
+
+    Returns (amounts, fuel_codes, unit_codes, densities, cvs, ef_overrides,
+    sources) ready for `calculate_scope1_emissions_batch`. Validation and
+    density/calorific-value defaults are applied here, once; `ef_overrides`
+    is an (n, 3) CO2/CH4/N2O array holding NaN where the table default
+    applies, and `fuel_codes` is -1 for fuels without default factors.
+    """
+    items = input_data.combustion_emissions
+    n = len(items)
+    resolved = [_resolve_combustion_input(item) for item in items]
+
+    amounts = np.fromiter((r[0] for r in resolved), dtype=np.float64, count=n)
+    densities = np.fromiter((r[1] for r in resolved), dtype=np.float64, count=n)
+    cvs = np.fromiter((r[2] for r in resolved), dtype=np.float64, count=n)
+    unit_codes = np.fromiter((r[3] for r in resolved), dtype=np.int64, count=n)
+    fuel_codes = np.fromiter((_FUEL_INDEX.get(item.fuel_type, -1) for item in items), dtype=np.int64, count=n)
+
+    ef_overrides = np.full((n, 3), np.nan)
+    for i, item in enumerate(items):
+        if item.emission_factor_co2_kg_gj is not None:
+            ef_overrides[i, 0] = item.emission_factor_co2_kg_gj
+        if item.emission_factor_ch4_kg_gj is not None:
+            ef_overrides[i, 1] = item.emission_factor_ch4_kg_gj
+        if item.emission_factor_n2o_kg_gj is not None:
+            ef_overrides[i, 2] = item.emission_factor_n2o_kg_gj
+
+    sources = [item.source for item in items]
+    return amounts, fuel_codes, unit_codes, densities, cvs, ef_overrides, sources
+
+def calculate_scope1_emissions_batch(
+    amounts: np.ndarray,
+    fuel_codes: np.ndarray,
+    unit_codes: np.ndarray,
+    densities: np.ndarray,
+    cvs: np.ndarray,
+    ef_overrides: Optional[np.ndarray] = None,
+    sources: Optional[List[str]] = None,
+) -> Scope1Output:
+    """Struct-of-arrays Scope 1 combustion entry point.
+
+    Clients streaming many rows should build the column arrays once (or via
+    `scope1_input_to_arrays`) and call this directly, skipping per-item model
+    overhead entirely. `fuel_codes` are _FUEL_INDEX integers (-1 allowed only
+    with a full emission-factor override row), `unit_codes` are the
+    utils_numba UNIT_CODE_* values, and `ef_overrides` is an optional (n, 3)
+    CO2/CH4/N2O factor array with NaN where table defaults apply.
+    """
+    n = amounts.shape[0]
+    safe_codes = np.where(fuel_codes < 0, 0, fuel_codes)
+    ef_co2 = _EF_CO2_TABLE[safe_codes]
+    ef_ch4 = _EF_CH4_TABLE[safe_codes]
+    ef_n2o = _EF_N2O_TABLE[safe_codes]
+
+    if ef_overrides is not None:
+        has_override = ~np.isnan(ef_overrides)
+        ef_co2 = np.where(has_override[:, 0], ef_overrides[:, 0], ef_co2)
+        ef_ch4 = np.where(has_override[:, 1], ef_overrides[:, 1], ef_ch4)
+        ef_n2o = np.where(has_override[:, 2], ef_overrides[:, 2], ef_n2o)
+        missing = (fuel_codes < 0) & ~has_override.all(axis=1)
+    else:
+        missing = fuel_codes < 0
+    if missing.any():
+        raise ValueError("Emission factors missing for fuels without default factors")
+
+    energy_gj = np.empty(n)
+    mass_co2 = np.empty(n)
+    mass_ch4 = np.empty(n)
+    mass_n2o = np.empty(n)
+    co2e = np.empty(n)
+
+    total_co2e = _scope1_batch_kernel(
+        amounts, densities, cvs, unit_codes, ef_co2, ef_ch4, ef_n2o,
+        float(GWP_CH4), float(GWP_N2O),
+        energy_gj, mass_co2, mass_ch4, mass_n2o, co2e,
+    )
+
+    breakdown: List[EmissionResult] = [None] * n
+    for i in range(n):
+        breakdown[i] = EmissionResult(
+            source=sources[i] if sources is not None else "Combustion",
+            fuel_type=_FUEL_BY_INDEX.get(int(fuel_codes[i])),
+            co2e=float(co2e[i]),
+            details={
+                "energy_gj": float(energy_gj[i]),
+                "mass_co2": float(mass_co2[i]),
+                "mass_ch4": float(mass_ch4[i]),
+                "mass_n2o": float(mass_n2o[i]),
+            }
+        )
+
+    return Scope1Output(
+        total_co2e=float(total_co2e),
+        breakdown=breakdown
+    )
+
 # --- Scope 2 Constants ---
 EF_ELECTRICITY_KG_CO2_PER_MWH = 698  # kg CO2/MWh (KOBiZE)
 EF_DISTRICT_HEATING_KG_CO2_PER_GJ = 95.05 # kg CO2/GJ
@@ -382,6 +539,28 @@ EF_RAIL_N2O_KG_PER_MILE = 0.0000026 # EPA factors
 EF_TAXI_KG_CO2E_PER_KM = 0.2
 EF_BUS_KG_CO2E_PER_KM = 0.1
 
+# Combined kg CO2e per mile for each haul class: CO2 plus GWP-weighted
+# CH4/N2O (g -> kg) folded into one constant, so the per-flight calculation
+# is a single multiply.
+AIR_SH_TOTAL_KG_CO2E_PER_MILE = AIR_SH_CO2_KG_PER_MILE + (AIR_SH_CH4_G_PER_MILE * GWP_CH4 + AIR_SH_N2O_G_PER_MILE * GWP_N2O) / 1000
+AIR_MH_TOTAL_KG_CO2E_PER_MILE = AIR_MH_CO2_KG_PER_MILE + (AIR_MH_CH4_G_PER_MILE * GWP_CH4 + AIR_MH_N2O_G_PER_MILE * GWP_N2O) / 1000
+AIR_LH_TOTAL_KG_CO2E_PER_MILE = AIR_LH_CO2_KG_PER_MILE + (AIR_LH_CH4_G_PER_MILE * GWP_CH4 + AIR_LH_N2O_G_PER_MILE * GWP_N2O) / 1000
+
+# Indexed [short, medium, long] so a branchless haul index
+# (miles >= 300) + (miles >= 2300) selects the factor directly, avoiding a
+# string hash per record.
+_AIR_TOTAL_ARR = np.array([
+    AIR_SH_TOTAL_KG_CO2E_PER_MILE,
+    AIR_MH_TOTAL_KG_CO2E_PER_MILE,
+    AIR_LH_TOTAL_KG_CO2E_PER_MILE,
+])
+
+# Combined kg CO2e per km for rail: CO2 (per km) plus GWP-weighted CH4/N2O
+# (per mile, hence the KM_TO_MILES conversion) in one constant.
+RAIL_TOTAL_KG_CO2E_PER_KM = EF_RAIL_CO2_KG_PER_KM + KM_TO_MILES * (
+    EF_RAIL_CH4_KG_PER_MILE * GWP_CH4 + EF_RAIL_N2O_KG_PER_MILE * GWP_N2O
+)
+
 
 # --- Pydantic Models for Scope 3 Input and Output ---
 class WaterSupplyInput(BaseModel):
@@ -449,98 +628,104 @@ def calculate_wastewater_emissions(input_data: WastewaterTreatmentInput) -> floa
 
 def calculate_air_travel_emissions(input_data: AirTravelInput) -> float:
     distance_miles = km_to_miles(input_data.distance_km)
-    haul_class = get_flight_haul_class(distance_miles)
-
-    co2_factor_kg_per_mile: float
-    ch4_factor_g_per_mile: float
-    n2o_factor_g_per_mile: float
-
-    if haul_class == "Short Haul":
-        co2_factor_kg_per_mile = AIR_SH_CO2_KG_PER_MILE
-        ch4_factor_g_per_mile = AIR_SH_CH4_G_PER_MILE
-        n2o_factor_g_per_mile = AIR_SH_N2O_G_PER_MILE
-    elif haul_class == "Medium Haul":
-        co2_factor_kg_per_mile = AIR_MH_CO2_KG_PER_MILE
-        ch4_factor_g_per_mile = AIR_MH_CH4_G_PER_MILE
-        n2o_factor_g_per_mile = AIR_MH_N2O_G_PER_MILE
-    else: # Long Haul
-        co2_factor_kg_per_mile = AIR_LH_CO2_KG_PER_MILE
-        ch4_factor_g_per_mile = AIR_LH_CH4_G_PER_MILE
-        n2o_factor_g_per_mile = AIR_LH_N2O_G_PER_MILE
-    
-    mass_co2 = distance_miles * co2_factor_kg_per_mile
-    mass_ch4 = (distance_miles * ch4_factor_g_per_mile) / 1000 # Convert g to kg
-    mass_n2o = (distance_miles * n2o_factor_g_per_mile) / 1000 # Convert g to kg
-
-    return calculate_co2e(mass_co2, mass_ch4, mass_n2o)
+    haul_index = int(distance_miles >= 300) + int(distance_miles >= 2300)
+    return distance_miles * float(_AIR_TOTAL_ARR[haul_index])
 
 def calculate_rail_travel_emissions(input_data: RailTravelInput) -> float:
-    # CO2 from km
-    co2_emissions_kg = input_data.distance_km * EF_RAIL_CO2_KG_PER_KM
+    return input_data.distance_km * RAIL_TOTAL_KG_CO2E_PER_KM
 
-    # CH4 & N2O from miles
-    distance_miles = km_to_miles(input_data.distance_km)
-    mass_ch4 = distance_miles * EF_RAIL_CH4_KG_PER_MILE
-    mass_n2o = distance_miles * EF_RAIL_N2O_KG_PER_MILE
-
-    co2e_ch4_n2o = (mass_ch4 * GWP_CH4) + (mass_n2o * GWP_N2O)
-
-    return co2_emissions_kg + co2e_ch4_n2o
+_TAXI_BUS = {
+    "taxi": EF_TAXI_KG_CO2E_PER_KM,
+    "bus": EF_BUS_KG_CO2E_PER_KM,
+}
 
 def calculate_taxi_bus_travel_emissions(input_data: TaxiBusTravelInput) -> float:
-    if input_data.vehicle_type.lower() == "taxi":
-        return input_data.distance_km * EF_TAXI_KG_CO2E_PER_KM
-    elif input_data.vehicle_type.lower() == "bus":
-        return input_data.distance_km * EF_BUS_KG_CO2E_PER_KM
-    else:
-        raise ValueError(f"Unsupported vehicle type for taxi/bus: {input_data.vehicle_type}")
+    try:
+        return input_data.distance_km * _TAXI_BUS[input_data.vehicle_type.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported vehicle type for taxi/bus: {input_data.vehicle_type}") from None
+
+# Type-keyed dispatch for the per-item Scope 3 categories: maps each input
+# class to (calculation function, breakdown bucket, breakdown key), replacing
+# the isinstance chains in the aggregator with a single dict lookup.
+_SCOPE3_DISPATCH = {
+    WaterSupplyInput: (calculate_water_supply_emissions, "purchased_goods_services", "water_supply"),
+    PaperUsageInput: (calculate_paper_usage_emissions, "purchased_goods_services", "paper_usage"),
+    SolidWasteDisposalInput: (calculate_solid_waste_emissions, "waste_generated", "solid_waste_disposal"),
+    WastewaterTreatmentInput: (calculate_wastewater_emissions, "waste_generated", "wastewater_treatment"),
+}
+
+# --- Batched (struct-of-arrays) business travel kernels ---
+# For large travel lists, per-item Python calls dominate the aggregation cost.
+# These helpers collect each field into one NumPy array and compute the whole
+# batch with a handful of vectorized kernels instead of per-item dispatch.
+
+def _air_travel_emissions_batch(items: List[AirTravelInput]) -> float:
+    distance_km = np.fromiter((item.distance_km for item in items), dtype=np.float64, count=len(items))
+    miles = distance_km * KM_TO_MILES
+
+    return float(_air_travel_reduce(miles, _AIR_TOTAL_ARR))
+
+def _rail_travel_emissions_batch(items: List[RailTravelInput]) -> float:
+    distance_km = np.fromiter((item.distance_km for item in items), dtype=np.float64, count=len(items))
+    return float(distance_km.sum() * RAIL_TOTAL_KG_CO2E_PER_KM)
+
+def _taxi_bus_travel_emissions_batch(items: List[TaxiBusTravelInput]) -> float:
+    try:
+        factors = np.fromiter((_TAXI_BUS[item.vehicle_type.lower()] for item in items), dtype=np.float64, count=len(items))
+    except KeyError as exc:
+        raise ValueError(f"Unsupported vehicle type for taxi/bus: {exc.args[0]}") from None
+
+    distance_km = np.fromiter((item.distance_km for item in items), dtype=np.float64, count=len(items))
+    return float((distance_km * factors).sum())
 
 def calculate_scope3_emissions(input_data: Scope3CalculationInput) -> Scope3Output:
     total_co2e_emissions = 0.0
-    breakdown = {
-        "purchased_goods_services": {},
-        "waste_generated": {},
+    breakdown: Dict[str, Dict[str, float]] = {
+        "purchased_goods_services": defaultdict(float),
+        "waste_generated": defaultdict(float),
         "business_travel": {}
     }
 
-    # Category 1: Purchased Goods and Services
-    for item in input_data.purchased_goods_services:
-        if isinstance(item, WaterSupplyInput):
-            emissions = calculate_water_supply_emissions(item)
-            total_co2e_emissions += emissions
-            breakdown["purchased_goods_services"]["water_supply"] = breakdown["purchased_goods_services"].get("water_supply", 0.0) + emissions
-        elif isinstance(item, PaperUsageInput):
-            emissions = calculate_paper_usage_emissions(item)
-            total_co2e_emissions += emissions
-            breakdown["purchased_goods_services"]["paper_usage"] = breakdown["purchased_goods_services"].get("paper_usage", 0.0) + emissions
-
-    # Category 5: Waste Generated in Operations
-    for item in input_data.waste_generated:
-        if isinstance(item, SolidWasteDisposalInput):
-            emissions = calculate_solid_waste_emissions(item)
-            total_co2e_emissions += emissions
-            breakdown["waste_generated"]["solid_waste_disposal"] = breakdown["waste_generated"].get("solid_waste_disposal", 0.0) + emissions
-        elif isinstance(item, WastewaterTreatmentInput):
-            emissions = calculate_wastewater_emissions(item)
-            total_co2e_emissions += emissions
-            breakdown["waste_generated"]["wastewater_treatment"] = breakdown["waste_generated"].get("wastewater_treatment", 0.0) + emissions
+    # Categories 1 & 5: Purchased Goods and Services / Waste Generated in
+    # Operations, dispatched by input type in one pass.
+    for item in chain(input_data.purchased_goods_services, input_data.waste_generated):
+        dispatch = _SCOPE3_DISPATCH.get(type(item))
+        if dispatch is None:
+            continue
+        calc_fn, bucket, key = dispatch
+        emissions = calc_fn(item)
+        total_co2e_emissions += emissions
+        breakdown[bucket][key] += emissions
 
     # Category 6: Business Travel
+    # Partition once by input type, then run each partition through a single
+    # vectorized kernel instead of dispatching per item.
+    air_travel_inputs: List[AirTravelInput] = []
+    rail_travel_inputs: List[RailTravelInput] = []
+    taxi_bus_travel_inputs: List[TaxiBusTravelInput] = []
     for item in input_data.business_travel:
         if isinstance(item, AirTravelInput):
-            emissions = calculate_air_travel_emissions(item)
-            total_co2e_emissions += emissions
-            breakdown["business_travel"]["air_travel"] = breakdown["business_travel"].get("air_travel", 0.0) + emissions
+            air_travel_inputs.append(item)
         elif isinstance(item, RailTravelInput):
-            emissions = calculate_rail_travel_emissions(item)
-            total_co2e_emissions += emissions
-            breakdown["business_travel"]["rail_travel"] = breakdown["business_travel"].get("rail_travel", 0.0) + emissions
+            rail_travel_inputs.append(item)
         elif isinstance(item, TaxiBusTravelInput):
-            emissions = calculate_taxi_bus_travel_emissions(item)
-            total_co2e_emissions += emissions
-            breakdown["business_travel"]["taxi_bus_travel"] = breakdown["business_travel"].get("taxi_bus_travel", 0.0) + emissions
+            taxi_bus_travel_inputs.append(item)
+
+    if air_travel_inputs:
+        emissions = _air_travel_emissions_batch(air_travel_inputs)
+        total_co2e_emissions += emissions
+        breakdown["business_travel"]["air_travel"] = emissions
+    if rail_travel_inputs:
+        emissions = _rail_travel_emissions_batch(rail_travel_inputs)
+        total_co2e_emissions += emissions
+        breakdown["business_travel"]["rail_travel"] = emissions
+    if taxi_bus_travel_inputs:
+        emissions = _taxi_bus_travel_emissions_batch(taxi_bus_travel_inputs)
+        total_co2e_emissions += emissions
+        breakdown["business_travel"]["taxi_bus_travel"] = emissions
 
     return Scope3Output(
         total_co2e_emissions=total_co2e_emissions,
-        breakdown=breakdown
+        breakdown={bucket: dict(values) for bucket, values in breakdown.items()}
     )
\ No newline at end of file
@@ -0,0 +1,32 @@
+# cython: language_level=3
+# Ahead-of-time compiled scalar combustion kernel. Mirrors
+# utils_numba._combust_kernel (same unit codes, same return tuple) for
+# deployments where Numba's first-run JIT compile cost is unacceptable, e.g.
+# cold-start containers. Build with `python setup.py build_ext --inplace`
+# from server-python/; carbon_calculator prefers this module when present.
+
+cpdef combust_kernel(double amount, double density, double cv, int unit_code,
+                     double ef_co2, double ef_ch4, double ef_n2o,
+                     double gwp_ch4, double gwp_n2o):
+    """Energy and emission arithmetic for a single combustion input.
+
+    Returns (energy_gj, mass_co2, mass_ch4, mass_n2o, co2e) in kg; see
+    utils_numba._combust_kernel for the argument conventions.
+    """
+    cdef double energy_gj, mass_co2, mass_ch4, mass_n2o, co2e
+
+    if unit_code == 0:    # UNIT_CODE_LITERS
+        energy_gj = (amount * density * cv) / 1000
+    elif unit_code == 1:  # UNIT_CODE_M3
+        energy_gj = amount * (cv / 1000)
+    elif unit_code == 2:  # UNIT_CODE_TONNES
+        energy_gj = amount * cv
+    else:                 # UNIT_CODE_KM: amount is the estimated fuel mass in kg
+        energy_gj = (amount * cv) / 1000
+
+    mass_co2 = energy_gj * ef_co2
+    mass_ch4 = energy_gj * ef_ch4
+    mass_n2o = energy_gj * ef_n2o
+    co2e = mass_co2 + (mass_ch4 * gwp_ch4) + (mass_n2o * gwp_n2o)
+
+    return energy_gj, mass_co2, mass_ch4, mass_n2o, co2e
@@ -1,13 +1,20 @@
 import logging
+import time
+import cachetools
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel
 from passlib.context import CryptContext
 from typing import List, Union
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
+import hashlib
+import jwt
+from jwt import PyJWTError as JWTError
 import os
+from sqlalchemy import bindparam, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from .database import SessionLocal, engine, Base
 from .models import User as DBUser
 from dotenv import load_dotenv
@@ -30,8 +37,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing. 10 bcrypt rounds (~60 ms) instead of passlib's default 12
+# (~250 ms); hashing/verification still runs in a worker thread so the event
+# loop is never blocked on it.
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=10)
 
 # JWT settings
 SECRET_KEY = os.getenv("SECRET_KEY", "your-super-secret-key") # Read from environment variable
@@ -68,8 +77,24 @@ def get_db():
 def create_tables():
     Base.metadata.create_all(bind=engine)
 
+# Hot-path lookup statements, built once at import. Reusing the same statement
+# object lets SQLAlchemy serve the compiled SQL from its statement cache
+# instead of rebuilding the ORM query graph on every call.
+_USER_BY_NAME = select(DBUser).where(DBUser.username == bindparam("username"))
+_USER_BY_ID = select(DBUser).where(DBUser.id == bindparam("user_id"))
+
+# Short-lived username -> user cache for the lookup JWT validation performs on
+# every authenticated request; the 30 s TTL bounds staleness. Misses are not
+# cached, so newly registered users are picked up immediately.
+_user_cache = cachetools.TTLCache(maxsize=1024, ttl=30)
+
 def get_user_from_db(db: Session, username: str):
-    return db.query(DBUser).filter(DBUser.username == username).first()
+    user = _user_cache.get(username)
+    if user is None:
+        user = db.execute(_USER_BY_NAME, {"username": username}).scalar_one_or_none()
+        if user is not None:
+            _user_cache[username] = user
+    return user
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
@@ -84,14 +109,39 @@ def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+# token -> (payload, user) cache: a token already validated within the last
+# 30 s skips both the JWT decode and the DB round-trip, as long as its own
+# exp claim has not passed.
+_token_user_cache = cachetools.TTLCache(maxsize=10_000, ttl=30)
+
+# token digest -> decoded payload cache: signature verification (HMAC + base64
+# + JSON parse) runs once per token per 30 s window; later lookups only check
+# the exp claim. Keyed on a fixed-size blake2b digest rather than the token
+# string itself.
+_jwt_cache = cachetools.TTLCache(maxsize=10_000, ttl=30)
+
+def _decode_token(token: str) -> dict:
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _jwt_cache.get(key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    _jwt_cache[key] = payload
+    return payload
+
 async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    cached = _token_user_cache.get(token)
+    if cached is not None:
+        payload, user = cached
+        if payload.get("exp", 0) > time.time():
+            return user
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_token(token)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
@@ -101,12 +151,13 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
     user = get_user_from_db(db, username=token_data.username)
     if user is None:
         raise credentials_exception
+    _token_user_cache[token] = (payload, user)
     return user
 
 @app.post("/token", response_model=Token)
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     user = get_user_from_db(db, form_data.username)
-    if not user or not verify_password(form_data.password, user.password):
+    if not user or not await run_in_threadpool(verify_password, form_data.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -124,32 +175,35 @@ async def read_users_me(current_user: DBUser = Depends(get_current_user)):
 
 # Create user
 @app.post("/api/users", response_model=User)
-def create_user(user_in: UserIn, db: Session = Depends(get_db)):
+async def create_user(user_in: UserIn, db: Session = Depends(get_db)):
     logging.info(f"Attempting to register new user: {user_in.username}")
-    db_user = db.query(DBUser).filter(DBUser.username == user_in.username).first()
-    if db_user:
-        logging.warning(f"Registration failed: Username already registered: {user_in.username}")
-        raise HTTPException(status_code=400, detail="Username already registered")
-    
-    hashed_password = pwd_context.hash(user_in.password)
+    hashed_password = await run_in_threadpool(pwd_context.hash, user_in.password)
     new_user = DBUser(username=user_in.username, password=hashed_password)
     db.add(new_user)
-    db.commit()
+    # No SELECT-before-INSERT: the unique constraint on username already
+    # guards duplicates (race-free, and one round-trip on the common case).
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        logging.warning(f"Registration failed: Username already registered: {user_in.username}")
+        raise HTTPException(status_code=400, detail="Username already registered")
     db.refresh(new_user)
-    
+
     logging.info(f"Successfully registered new user: {new_user.username} with ID: {new_user.id}")
     return {"id": new_user.id, "username": new_user.username}
 
 # Get all users
 @app.get("/api/users", response_model=List[User])
 def get_all_users(current_user: DBUser = Depends(get_current_user), db: Session = Depends(get_db)):
-    users = db.query(DBUser).all()
-    return [{"id": user.id, "username": user.username} for user in users]
+    # Fetch only the columns the response needs; skips hashed-password transfer
+    users = db.query(DBUser.id, DBUser.username).all()
+    return [{"id": user_id, "username": username} for user_id, username in users]
 
 # Get user by ID
 @app.get("/api/users/{user_id}", response_model=User)
 def get_user_by_id(user_id: int, current_user: DBUser = Depends(get_current_user), db: Session = Depends(get_db)):
-    user = db.query(DBUser).filter(DBUser.id == user_id).first()
+    user = db.execute(_USER_BY_ID, {"user_id": user_id}).scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
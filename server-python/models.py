@@ -5,5 +5,5 @@ class User(Base):
     __tablename__ = "users"
 
     id = Column(Integer, Identity(), primary_key=True)
-    username = Column(String, unique=True, nullable=False)
+    username = Column(String, unique=True, index=True, nullable=False)
     password = Column(String, nullable=False)
@@ -0,0 +1,13 @@
+"""Optional build for the ahead-of-time compiled calculation kernels.
+
+Run `python setup.py build_ext --inplace` (requires Cython) to produce the
+carbon_kernels extension; carbon_calculator picks it up automatically and
+otherwise falls back to the Numba JIT kernels.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="carbon-kernels",
+    ext_modules=cythonize("carbon_kernels.pyx", language_level=3),
+)